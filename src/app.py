@@ -2,25 +2,33 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+import orjson
 from flask import Flask
+from flask import Response
 from flask import jsonify
 from flask import render_template
 from flask import request
+from flask.json.provider import DefaultJSONProvider
+from waitress import serve
 
 from src.config import DEFAULT_OPENAI_MODEL
 from src.config import DEFAULT_TARGET_CURRENCY
 from src.config import FLASK_PORT
 from src.config import MAX_UPLOAD_SIZE_MB
 from src.config import TMP_DIR
+from src.datamodels import TranslateResponse
 from src.image_validation import ImageValidationError
 from src.image_validation import save_uploaded_image
 from src.services.forex_service import get_exchange_rate
 from src.services.forex_service import get_supported_currencies
 from src.services.image_search_brave import ImageSearchError
 from src.services.image_search_brave import cached_brave_search
+from src.services.openai_service import ImageDecodeError
 from src.services.openai_service import TranslationError
 from src.services.openai_service import translate_menu_image
 from src.values import BRAVE_API_KEY
@@ -33,14 +41,32 @@ logging.basicConfig(
 )
 logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 project_root = Path(__file__).parent.parent
 app = Flask(
     __name__,
     template_folder=str(project_root / "templates"),
     static_folder=str(project_root / "static"),
 )
+app.json = OrjsonProvider(app)
 app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
+# Max number of concurrent Brave image searches per request
+IMAGE_SEARCH_MAX_WORKERS = 5
+
+# Worker threads of the WSGI server; a long translation only occupies one of them
+SERVER_THREADS = 8
+
 
 @app.route("/")
 def index():
@@ -58,54 +84,50 @@ def status():
 def translate_menu():
     """Translate a menu image (without images).
 
+    Several images of the same menu (e.g. the pages of a fold-out menu) can be uploaded by
+    repeating the "image" field; they are translated together in a single request.
+
     Returns:
         JSON response with translated menu data (dishes without image_urls).
     """
     if "image" not in request.files:
         return jsonify({"status": "error", "message": "No image file provided"}), 400
 
-    file = request.files["image"]
+    files = request.files.getlist("image")
     target_currency = request.form.get("currency", DEFAULT_TARGET_CURRENCY)
     model = request.form.get("model", DEFAULT_OPENAI_MODEL)
-    file_content = file.read()
-    filename = file.filename
-    image_path = None
+    source_currency_hint = request.form.get("source_currency_hint", "").strip().upper() or None
+    image_paths = []
     try:
-        image_path = save_uploaded_image(file_content, filename)
-        metadata_path = TMP_DIR / "metadata.jsonl"
-        metadata_record = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "client_ip": request.remote_addr,
-            "image_path": str(image_path),
-            "original_filename": filename,
-        }
-        with metadata_path.open("a", encoding="utf-8") as f:
-            json.dump(metadata_record, f)
-            f.write("\n")
+        for file in files:
+            image_path = save_uploaded_image(file)
+            image_paths.append(image_path)
+            metadata_path = TMP_DIR / "metadata.jsonl"
+            metadata_record = {
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "client_ip": request.remote_addr,
+                "image_path": str(image_path),
+                "original_filename": file.filename,
+            }
+            with metadata_path.open("a", encoding="utf-8") as f:
+                json.dump(metadata_record, f)
+                f.write("\n")
     except ImageValidationError as e:
+        for image_path in image_paths:
+            image_path.unlink(missing_ok=True)
         return jsonify({"status": "error", "message": str(e)}), 400
 
     try:
-        translation = translate_menu_image(image_path, target_currency, model)
+        translation = translate_menu_image(image_paths, target_currency, model, source_currency_hint)
 
         # Return dishes without images - frontend will fetch them separately
-        dishes_data = []
         for dish in translation.dishes:
             dish.image_urls = None
-            dishes_data.append(dish.model_dump())
 
-        return jsonify(
-            {
-                "status": "success",
-                "data": {
-                    "source_language": translation.source_language,
-                    "dishes": dishes_data,
-                    "original_currency": translation.original_currency,
-                    "exchange_rate_to_eur": translation.exchange_rate_to_eur,
-                    "target_currency": translation.target_currency,
-                },
-            }
-        )
+        return Response(TranslateResponse(data=translation).model_dump_json(), mimetype="application/json")
+    except ImageDecodeError as e:
+        logger.warning(f"Image decode error: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 400
     except TranslationError as e:
         logger.error(f"Translation error: {e}")
         return jsonify({"status": "error", "message": f"Translation failed: {e}"}), 500
@@ -113,7 +135,7 @@ def translate_menu():
         logger.error(f"Unexpected error: {e}")
         return jsonify({"status": "error", "message": "An unexpected error occurred during translation"}), 500
     finally:
-        if image_path:
+        for image_path in image_paths:
             image_path.unlink(missing_ok=True)
 
 
@@ -142,6 +164,24 @@ def exchange_rate():
         return jsonify({"status": "error", "message": str(e)}), 400
 
 
+def _search_dish_images(dish_name: str, language: str) -> list[str] | None:
+    """Search images for a single dish, falling back to a placeholder if none are found.
+
+    Returns:
+        List of image URLs, or None if the search failed.
+    """
+    try:
+        search_results = cached_brave_search(dish_name, language, BRAVE_API_KEY)
+    except ImageSearchError as e:
+        logger.warning(f"Image search failed for '{dish_name}': {e}")
+        return None
+
+    if search_results:
+        return search_results
+    placeholder_url = f"https://via.placeholder.com/400x300?text={dish_name.replace(' ', '+')}"
+    return [placeholder_url]
+
+
 @app.route("/api/fetch-images", methods=["POST"])
 def fetch_images():
     """Fetch images for dishes.
@@ -169,31 +209,19 @@ def fetch_images():
             {"status": "success", "images": {dish.get("name"): None for dish in dishes if dish.get("name")}}
         )
 
-    images_data = {}
-    for dish in dishes:
-        dish_name = dish.get("name")
-        if not dish_name:
-            continue
-
-        try:
-            search_results = cached_brave_search(dish_name, language, BRAVE_API_KEY)
-            if search_results:
-                images_data[dish_name] = search_results
-            else:
-                placeholder_url = f"https://via.placeholder.com/400x300?text={dish_name.replace(' ', '+')}"
-                images_data[dish_name] = [placeholder_url]
-        except ImageSearchError as e:
-            logger.warning(f"Image search failed for '{dish_name}': {e}")
-            images_data[dish_name] = None
+    dish_names = [dish.get("name") for dish in dishes if dish.get("name")]
+    with ThreadPoolExecutor(max_workers=IMAGE_SEARCH_MAX_WORKERS) as executor:
+        results = executor.map(lambda dish_name: _search_dish_images(dish_name, language), dish_names)
+        images_data = dict(zip(dish_names, results))
 
     return jsonify({"status": "success", "images": images_data})
 
 
 def main():
-    """Run the Flask application."""
+    """Run the Flask application with the waitress WSGI server."""
     host = "0.0.0.0"
     logger.info(f"{host}:{FLASK_PORT}")
-    app.run(host="0.0.0.0", port=FLASK_PORT, debug=False)
+    serve(app, host=host, port=FLASK_PORT, threads=SERVER_THREADS)
 
 
 if __name__ == "__main__":
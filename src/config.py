@@ -1,5 +1,8 @@
 import tomllib
+from dataclasses import dataclass
+from dataclasses import fields
 from pathlib import Path
+from typing import Annotated
 
 import typer
 
@@ -10,13 +13,34 @@ with _config_file.open("rb") as f:
 _project_config = _config["project"]
 _tool_config = _config["tool"]["config"]
 
-PROJECT_NAME = _project_config["name"]
-PROJECT_VERSION = _project_config["version"]
 
-FLASK_PORT = _tool_config["flask_port"]
-MAX_UPLOAD_SIZE_MB = _tool_config["max_upload_size_mb"]
-DEFAULT_TARGET_CURRENCY = _tool_config["default_target_currency"]
-DEFAULT_OPENAI_MODEL = _tool_config["default_openai_model"]
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Non-secret configuration read from pyproject.toml."""
+
+    project_name: str
+    project_version: str
+    flask_port: int
+    max_upload_size_mb: int
+    default_target_currency: str
+    default_openai_model: str
+    brave_max_requests_per_second: int
+
+
+CONFIG = Config(
+    project_name=_project_config["name"],
+    project_version=_project_config["version"],
+    **_tool_config,
+)
+
+PROJECT_NAME = CONFIG.project_name
+PROJECT_VERSION = CONFIG.project_version
+
+FLASK_PORT = CONFIG.flask_port
+MAX_UPLOAD_SIZE_MB = CONFIG.max_upload_size_mb
+DEFAULT_TARGET_CURRENCY = CONFIG.default_target_currency
+DEFAULT_OPENAI_MODEL = CONFIG.default_openai_model
+BRAVE_MAX_REQUESTS_PER_SECOND = CONFIG.brave_max_requests_per_second
 
 # Cache directory for all services
 CACHE_DIR = Path(".cache")
@@ -27,15 +51,22 @@ TMP_DIR.mkdir(exist_ok=True)
 
 
 def config_cli(
-    all: bool = typer.Option(False, "--all", help="Show all configuration values"),
-    project_name: bool = typer.Option(False, "--project-name", help=PROJECT_NAME),
-    project_version: bool = typer.Option(False, "--project-version", help=PROJECT_VERSION),
-    flask_port: bool = typer.Option(False, "--flask-port", help=str(FLASK_PORT)),
-    max_upload_size_mb: bool = typer.Option(False, "--max-upload-size-mb", help=str(MAX_UPLOAD_SIZE_MB)),
-    default_target_currency: bool = typer.Option(
-        False, "--default-target-currency", help=DEFAULT_TARGET_CURRENCY
-    ),
-    default_openai_model: bool = typer.Option(False, "--default-openai-model", help=DEFAULT_OPENAI_MODEL),
+    all: Annotated[bool, typer.Option("--all", help="Show all configuration values")] = False,
+    project_name: Annotated[bool, typer.Option("--project-name", help=PROJECT_NAME)] = False,
+    project_version: Annotated[bool, typer.Option("--project-version", help=PROJECT_VERSION)] = False,
+    flask_port: Annotated[bool, typer.Option("--flask-port", help=str(FLASK_PORT))] = False,
+    max_upload_size_mb: Annotated[
+        bool, typer.Option("--max-upload-size-mb", help=str(MAX_UPLOAD_SIZE_MB))
+    ] = False,
+    default_target_currency: Annotated[
+        bool, typer.Option("--default-target-currency", help=DEFAULT_TARGET_CURRENCY)
+    ] = False,
+    default_openai_model: Annotated[
+        bool, typer.Option("--default-openai-model", help=DEFAULT_OPENAI_MODEL)
+    ] = False,
+    brave_max_requests_per_second: Annotated[
+        bool, typer.Option("--brave-max-requests-per-second", help=str(BRAVE_MAX_REQUESTS_PER_SECOND))
+    ] = False,
 ) -> None:
     """Get configuration values from pyproject.toml.
 
@@ -43,12 +74,8 @@ def config_cli(
     Secrets should be imported directly from src.values in your code.
     """
     if all:
-        typer.echo(f"project_name={PROJECT_NAME}")
-        typer.echo(f"project_version={PROJECT_VERSION}")
-        typer.echo(f"flask_port={FLASK_PORT}")
-        typer.echo(f"max_upload_size_mb={MAX_UPLOAD_SIZE_MB}")
-        typer.echo(f"default_target_currency={DEFAULT_TARGET_CURRENCY}")
-        typer.echo(f"default_openai_model={DEFAULT_OPENAI_MODEL}")
+        for field in fields(CONFIG):
+            typer.echo(f"{field.name}={getattr(CONFIG, field.name)}")
         return
 
     param_map = {
@@ -58,6 +85,7 @@ def config_cli(
         max_upload_size_mb: MAX_UPLOAD_SIZE_MB,
         default_target_currency: DEFAULT_TARGET_CURRENCY,
         default_openai_model: DEFAULT_OPENAI_MODEL,
+        brave_max_requests_per_second: BRAVE_MAX_REQUESTS_PER_SECOND,
     }
 
     for is_set, value in param_map.items():
@@ -1,5 +1,7 @@
 """Data models for menu translation application."""
 
+from typing import Literal
+
 from pydantic import BaseModel
 from pydantic import Field
 
@@ -50,3 +52,10 @@ class MenuTranslation(BaseModel):
     original_currency: str | None = None
     exchange_rate_to_eur: float | None = None
     target_currency: str = Field(default="EUR")
+
+
+class TranslateResponse(BaseModel):
+    """Represents a successful /api/translate response."""
+
+    status: Literal["success"] = "success"
+    data: MenuTranslation
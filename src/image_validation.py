@@ -5,78 +5,131 @@ import tempfile
 from io import BytesIO
 from pathlib import Path
 
-from PIL import Image
+from werkzeug.datastructures import FileStorage
 
 from src.config import MAX_UPLOAD_SIZE_MB, TMP_DIR
 
 logger = logging.getLogger(__name__)
 
-SUPPORTED_IMAGE_FORMATS = {"png", "jpeg", "jpg", "webp"}
+SUPPORTED_IMAGE_FORMATS = frozenset({"png", "jpeg", "jpg", "webp"})
+
+# Leading bytes identifying each format (WebP is "RIFF" + 4-byte size + "WEBP")
+_MAGIC_BYTES = {
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpeg",
+}
+# Leading bytes read for format sniffing and a first, cheap Pillow verify
+_HEADER_SIZE = 64 * 1024
+# Errors Pillow raises for unreadable, truncated or corrupt images
+_PILLOW_ERRORS = (OSError, SyntaxError, ValueError, TypeError)
 
 
 class ImageValidationError(Exception):
     """Raised when image validation fails."""
 
 
-def validate_image_file(file_content: bytes, filename: str) -> None:
-    """Validate an uploaded image file.
-
-    Args:
-        file_content: Raw file content as bytes.
-        filename: Original filename.
-
-    Raises:
-        ImageValidationError: If validation fails.
-    """
+def _check_filename(filename: str) -> None:
+    """Reject a missing filename."""
     if not filename:
         raise ImageValidationError("Filename cannot be empty")
 
-    if not file_content:
+
+def _check_size(size: int) -> None:
+    """Reject empty files and files larger than MAX_UPLOAD_SIZE_MB."""
+    if not size:
         raise ImageValidationError("File is empty")
 
     max_size_bytes = MAX_UPLOAD_SIZE_MB * 1024 * 1024
-    if len(file_content) > max_size_bytes:
+    if size > max_size_bytes:
         raise ImageValidationError(
-            f"File size ({len(file_content) / (1024 * 1024):.2f}MB) exceeds maximum of {MAX_UPLOAD_SIZE_MB}MB"
+            f"File size ({size / (1024 * 1024):.2f}MB) exceeds maximum of {MAX_UPLOAD_SIZE_MB}MB"
         )
 
-    file_path = Path(filename)
-    extension = file_path.suffix.lower().lstrip(".")
+
+def _check_extension(filename: str) -> None:
+    """Reject filenames without a supported image extension."""
+    extension = Path(filename).suffix.lower().lstrip(".")
     if extension not in SUPPORTED_IMAGE_FORMATS:
         raise ImageValidationError(
             f"Unsupported file format: {extension}. "
             f"Supported formats: {', '.join(SUPPORTED_IMAGE_FORMATS)}"
         )
 
+
+def _sniff_format(header: bytes) -> str | None:
+    """Return the image format identified by the file's leading bytes, if any."""
+    for magic, image_format in _MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return image_format
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _verify_image(header: bytes, image_file: BytesIO | Path, filename: str) -> None:
+    """Reject files that are not a valid image.
+
+    Every file is opened by Pillow, which only parses the header. Files whose magic bytes match
+    their extension are accepted once that succeeds; anything else is also run through Pillow's
+    verify. Both steps try the header alone first and fall back to the whole file if the header
+    cuts the image short.
+    """
+    extension = Path(filename).suffix.lower().lstrip(".")
+    trusted_format = _sniff_format(header) == ("jpeg" if extension == "jpg" else extension)
+
+    from PIL import Image
+
     try:
-        image = Image.open(BytesIO(file_content))
-        image.verify()
-    except (OSError, ValueError, TypeError) as e:
+        with Image.open(BytesIO(header)) as image:
+            if not trusted_format:
+                image.verify()
+        return
+    except _PILLOW_ERRORS as e:
+        if len(header) < _HEADER_SIZE:
+            raise ImageValidationError(f"Invalid image file '{filename}': {e}") from e
+
+    try:
+        with Image.open(image_file) as image:
+            if not trusted_format:
+                image.verify()
+    except _PILLOW_ERRORS as e:
         raise ImageValidationError(f"Invalid image file '{filename}': {e}") from e
 
-    logger.info(f"Image validation passed for file: {filename}")
 
+def save_uploaded_image(file_storage: FileStorage) -> Path:
+    """Stream an uploaded image file to temporary directory and validate it.
 
-def save_uploaded_image(file_content: bytes, filename: str) -> Path:
-    """Save an uploaded image file to temporary directory.
+    The upload is copied to disk in chunks, so the file is never held in memory as a whole.
 
     Args:
-        file_content: Raw file content as bytes.
-        filename: Original filename.
+        file_storage: Uploaded file from the request.
 
     Returns:
         Path to saved temporary file.
 
     Raises:
-        ImageValidationError: If validation fails.
+        ImageValidationError: If validation fails. The temporary file is removed.
         OSError: If file cannot be saved.
     """
-    validate_image_file(file_content, filename)
+    filename = file_storage.filename or ""
+    _check_filename(filename)
+    _check_extension(filename)
+    if file_storage.content_length:
+        _check_size(file_storage.content_length)
 
     suffix = Path(filename).suffix or ".jpg"
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=TMP_DIR) as tmp_file:
-        tmp_file.write(file_content)
+        file_storage.save(tmp_file)
         tmp_path = Path(tmp_file.name)
 
+    try:
+        _check_size(tmp_path.stat().st_size)
+        with tmp_path.open("rb") as f:
+            header = f.read(_HEADER_SIZE)
+        _verify_image(header, tmp_path, filename)
+    except ImageValidationError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
     logger.info(f"Saved uploaded image to temporary file: {tmp_path}")
     return tmp_path
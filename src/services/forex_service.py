@@ -1,6 +1,8 @@
 """Forex exchange rate service."""
 
+import functools
 import logging
+import time
 
 import pycountry
 import requests
@@ -9,11 +11,14 @@ from babel import Locale
 from joblib import Memory
 
 from src.config import CACHE_DIR
+from src.services.http_session import create_session
 
 logger = logging.getLogger(__name__)
 
 memory = Memory(CACHE_DIR / "forex_rates", verbose=0)
 
+_session = create_session()
+
 
 def _flag_emoji(alpha_2: str) -> str:
     """Return regional indicator flag emoji for a 2-letter ISO 3166-1 alpha-2 code."""
@@ -22,9 +27,8 @@ def _flag_emoji(alpha_2: str) -> str:
     return "".join(chr(0x1F1E6 - ord("A") + ord(c)) for c in alpha_2.upper())
 
 
-@memory.cache
 def get_exchange_rate(from_currency: str, to_currency: str) -> float:
-    """Cached exchange rate fetch from exchangerate-api.io.
+    """Exchange rate from exchangerate-api.io, cached in-process for the current hour.
 
     Args:
         from_currency: Source currency code (e.g., "USD").
@@ -39,10 +43,26 @@ def get_exchange_rate(from_currency: str, to_currency: str) -> float:
     if from_currency == to_currency:
         return 1.0
 
+    hour_bucket = int(time.time()) // 3600
+    return _get_exchange_rate_for_hour(from_currency, to_currency, hour_bucket)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_exchange_rate_for_hour(from_currency: str, to_currency: str, hour_bucket: int) -> float:
+    """Memoized exchange rate fetch; hour_bucket only makes entries expire every hour."""
+    return _fetch_exchange_rate(from_currency, to_currency)
+
+
+def _fetch_exchange_rate(from_currency: str, to_currency: str) -> float:
+    """Fetch the exchange rate from exchangerate-api.io.
+
+    Raises:
+        ValueError: If API request fails or returns invalid data.
+    """
     url = f"https://api.exchangerate-api.com/v4/latest/{from_currency}"
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _session.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
 
@@ -62,6 +82,8 @@ def get_exchange_rate(from_currency: str, to_currency: str) -> float:
         raise ValueError(f"Invalid exchange rate response: {e}") from e
 
 
+# Memoized in-process as well, like image_search_brave.cached_brave_search
+@functools.lru_cache(maxsize=1)
 @memory.cache
 def get_supported_currency_codes() -> list[str]:
     """Fetch list of supported currency codes from the exchange rate API.
@@ -74,7 +96,7 @@ def get_supported_currency_codes() -> list[str]:
     """
     url = "https://api.exchangerate-api.com/v4/latest/USD"
     try:
-        response = requests.get(url, timeout=5)
+        response = _session.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
     except requests.RequestException as e:
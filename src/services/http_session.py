@@ -0,0 +1,48 @@
+"""Shared HTTP session and rate limiting helpers for external API calls."""
+
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def create_session() -> requests.Session:
+    """Create a requests session with connection pooling and retries on transient errors.
+
+    Reusing one session per service keeps TCP/TLS connections to the API host alive between calls.
+
+    Returns:
+        Configured requests session.
+    """
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return session
+
+
+class RateLimiter:
+    """Thread-safe sliding-window rate limiter.
+
+    acquire() returns immediately while fewer than max_calls were made in the last period seconds,
+    and otherwise blocks only until the oldest call leaves the window.
+    """
+
+    def __init__(self, max_calls: int, period: float) -> None:
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another call is allowed, then record it."""
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.max_calls:
+                time.sleep(self.period - (now - self._calls[0]))
+                self._calls.popleft()
+            self._calls.append(time.monotonic())
@@ -1,12 +1,15 @@
 """Brave Search API image search service."""
 
+import functools
 import logging
-import time
 
 import requests
 from joblib import Memory
 
+from src.config import BRAVE_MAX_REQUESTS_PER_SECOND
 from src.config import CACHE_DIR
+from src.services.http_session import RateLimiter
+from src.services.http_session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,216 +20,71 @@ class ImageSearchError(Exception):
 
 memory = Memory(CACHE_DIR / "image_search_brave", verbose=0)
 
+_session = create_session()
+
+# Shared by all search threads; calls only wait when they would exceed the configured plan limit
+_rate_limiter = RateLimiter(max_calls=BRAVE_MAX_REQUESTS_PER_SECOND, period=1.0)
+
 BRAVE_API_BASE_URL = "https://api.search.brave.com/res/v1/images/search"
 
-BRAVE_LANGUAGE_TO_PARAMS = {
-    "Arabic": {
-        "search_lang": "ar",
-        "country": "SA",
-    },
-    "Basque": {
-        "search_lang": "eu",
-        "country": "ES",
-    },
-    "Bengali": {
-        "search_lang": "bn",
-        "country": "IN",
-    },
-    "Bulgarian": {
-        "search_lang": "bg",
-        "country": "ALL",
-    },
-    "Catalan": {
-        "search_lang": "ca",
-        "country": "ES",
-    },
-    "Chinese (Simplified)": {
-        "search_lang": "zh-hans",
-        "country": "CN",
-    },
-    "Chinese (Traditional)": {
-        "search_lang": "zh-hant",
-        "country": "TW",
-    },
-    "Croatian": {
-        "search_lang": "hr",
-        "country": "ALL",
-    },
-    "Czech": {
-        "search_lang": "cs",
-        "country": "ALL",
-    },
-    "Danish": {
-        "search_lang": "da",
-        "country": "DK",
-    },
-    "Dutch": {
-        "search_lang": "nl",
-        "country": "NL",
-    },
-    "English": {
-        "search_lang": "en",
-        "country": "US",
-    },
-    "English (United Kingdom)": {
-        "search_lang": "en-gb",
-        "country": "GB",
-    },
-    "Estonian": {
-        "search_lang": "et",
-        "country": "ALL",
-    },
-    "Finnish": {
-        "search_lang": "fi",
-        "country": "FI",
-    },
-    "French": {
-        "search_lang": "fr",
-        "country": "FR",
-    },
-    "Galician": {
-        "search_lang": "gl",
-        "country": "ES",
-    },
-    "German": {
-        "search_lang": "de",
-        "country": "DE",
-    },
-    "Greek": {
-        "search_lang": "el",
-        "country": "GR",
-    },
-    "Gujarati": {
-        "search_lang": "gu",
-        "country": "IN",
-    },
-    "Hebrew": {
-        "search_lang": "he",
-        "country": "ALL",
-    },
-    "Hindi": {
-        "search_lang": "hi",
-        "country": "IN",
-    },
-    "Hungarian": {
-        "search_lang": "hu",
-        "country": "ALL",
-    },
-    "Icelandic": {
-        "search_lang": "is",
-        "country": "ALL",
-    },
-    "Italian": {
-        "search_lang": "it",
-        "country": "IT",
-    },
-    "Japanese": {
-        "search_lang": "jp",  # Brave-specific (not ISO)
-        "country": "JP",
-    },
-    "Kannada": {
-        "search_lang": "kn",
-        "country": "IN",
-    },
-    "Korean": {
-        "search_lang": "ko",
-        "country": "KR",
-    },
-    "Latvian": {
-        "search_lang": "lv",
-        "country": "ALL",
-    },
-    "Lithuanian": {
-        "search_lang": "lt",
-        "country": "ALL",
-    },
-    "Malay": {
-        "search_lang": "ms",
-        "country": "MY",
-    },
-    "Malayalam": {
-        "search_lang": "ml",
-        "country": "IN",
-    },
-    "Marathi": {
-        "search_lang": "mr",
-        "country": "IN",
-    },
-    "Norwegian Bokmål": {
-        "search_lang": "nb",
-        "country": "NO",
-    },
-    "Polish": {
-        "search_lang": "pl",
-        "country": "PL",
-    },
-    "Portuguese (Brazil)": {
-        "search_lang": "pt-br",
-        "country": "BR",
-    },
-    "Portuguese (Portugal)": {
-        "search_lang": "pt-pt",
-        "country": "PT",
-    },
-    "Punjabi": {
-        "search_lang": "pa",
-        "country": "IN",
-    },
-    "Romanian": {
-        "search_lang": "ro",
-        "country": "ALL",
-    },
-    "Russian": {
-        "search_lang": "ru",
-        "country": "RU",
-    },
-    "Serbian": {
-        "search_lang": "sr",
-        "country": "ALL",
-    },
-    "Slovak": {
-        "search_lang": "sk",
-        "country": "ALL",
-    },
-    "Slovenian": {
-        "search_lang": "sl",
-        "country": "ALL",
-    },
-    "Spanish": {
-        "search_lang": "es",
-        "country": "ES",
-    },
-    "Swedish": {
-        "search_lang": "sv",
-        "country": "SE",
-    },
-    "Tamil": {
-        "search_lang": "ta",
-        "country": "IN",
-    },
-    "Telugu": {
-        "search_lang": "te",
-        "country": "IN",
-    },
-    "Thai": {
-        "search_lang": "th",
-        "country": "ALL",
-    },
-    "Turkish": {
-        "search_lang": "tr",
-        "country": "TR",
-    },
-    "Ukrainian": {
-        "search_lang": "uk",
-        "country": "ALL",
-    },
-    "Vietnamese": {
-        "search_lang": "vi",
-        "country": "ALL",
-    },
+# Language name -> (search_lang, country) parameters for the Brave API
+BRAVE_LANGUAGE_TO_PARAMS: dict[str, tuple[str, str]] = {
+    "Arabic": ("ar", "SA"),
+    "Basque": ("eu", "ES"),
+    "Bengali": ("bn", "IN"),
+    "Bulgarian": ("bg", "ALL"),
+    "Catalan": ("ca", "ES"),
+    "Chinese (Simplified)": ("zh-hans", "CN"),
+    "Chinese (Traditional)": ("zh-hant", "TW"),
+    "Croatian": ("hr", "ALL"),
+    "Czech": ("cs", "ALL"),
+    "Danish": ("da", "DK"),
+    "Dutch": ("nl", "NL"),
+    "English": ("en", "US"),
+    "English (United Kingdom)": ("en-gb", "GB"),
+    "Estonian": ("et", "ALL"),
+    "Finnish": ("fi", "FI"),
+    "French": ("fr", "FR"),
+    "Galician": ("gl", "ES"),
+    "German": ("de", "DE"),
+    "Greek": ("el", "GR"),
+    "Gujarati": ("gu", "IN"),
+    "Hebrew": ("he", "ALL"),
+    "Hindi": ("hi", "IN"),
+    "Hungarian": ("hu", "ALL"),
+    "Icelandic": ("is", "ALL"),
+    "Italian": ("it", "IT"),
+    "Japanese": ("jp", "JP"),  # Brave-specific (not ISO)
+    "Kannada": ("kn", "IN"),
+    "Korean": ("ko", "KR"),
+    "Latvian": ("lv", "ALL"),
+    "Lithuanian": ("lt", "ALL"),
+    "Malay": ("ms", "MY"),
+    "Malayalam": ("ml", "IN"),
+    "Marathi": ("mr", "IN"),
+    "Norwegian Bokmål": ("nb", "NO"),
+    "Polish": ("pl", "PL"),
+    "Portuguese (Brazil)": ("pt-br", "BR"),
+    "Portuguese (Portugal)": ("pt-pt", "PT"),
+    "Punjabi": ("pa", "IN"),
+    "Romanian": ("ro", "ALL"),
+    "Russian": ("ru", "RU"),
+    "Serbian": ("sr", "ALL"),
+    "Slovak": ("sk", "ALL"),
+    "Slovenian": ("sl", "ALL"),
+    "Spanish": ("es", "ES"),
+    "Swedish": ("sv", "SE"),
+    "Tamil": ("ta", "IN"),
+    "Telugu": ("te", "IN"),
+    "Thai": ("th", "ALL"),
+    "Turkish": ("tr", "TR"),
+    "Ukrainian": ("uk", "ALL"),
+    "Vietnamese": ("vi", "ALL"),
 }
 
 
+# In-process memo over the joblib cache; repeat lookups skip its argument hashing and disk I/O
+@functools.lru_cache(maxsize=1024)
 @memory.cache
 def cached_brave_search(dish_name: str, language: str, api_key: str) -> list[str]:
     """Cached Brave Search API image search.
@@ -247,23 +105,25 @@ def cached_brave_search(dish_name: str, language: str, api_key: str) -> list[str
         "Accept": "application/json",
     }
 
-    search_lang = BRAVE_LANGUAGE_TO_PARAMS.get(language, {}).get("search_lang")
-    country = BRAVE_LANGUAGE_TO_PARAMS.get(language, {}).get("country")
+    language_params = BRAVE_LANGUAGE_TO_PARAMS.get(language)
     query = f"{dish_name}"
     # if we cant search by language, append the language to the search query
-    if not search_lang:
+    if language_params is None:
         query = f"{query} food {language}"
+        language_params = ("en", "ALL")
+    search_lang, country = language_params
 
     params = {
         "q": query,
         "count": 10,
-        "search_lang": search_lang or "en",
-        "country": country or "ALL",
+        "search_lang": search_lang,
+        "country": country,
         "spellcheck_off": "true",
     }
 
+    _rate_limiter.acquire()
     try:
-        response = requests.get(BRAVE_API_BASE_URL, headers=headers, params=params, timeout=10)
+        response = _session.get(BRAVE_API_BASE_URL, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
     except requests.RequestException as e:
@@ -294,5 +154,4 @@ def cached_brave_search(dish_name: str, language: str, api_key: str) -> list[str
         logger.warning(f"No valid image URLs for {params=}")
 
     logger.debug(f"{len(image_urls)} images found for Brave Image Search: {params=}")
-    time.sleep(0.7)
     return image_urls
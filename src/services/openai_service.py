@@ -1,12 +1,18 @@
 """OpenAI Vision API service for menu translation."""
 
 import base64
+import functools
+import hashlib
 import logging
+import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from joblib import Memory
-from openai import Client
 
 from src.config import CACHE_DIR
 from src.config import DEFAULT_OPENAI_MODEL
@@ -17,15 +23,34 @@ from src.datamodels import OpenAIResponse
 from src.services.forex_service import get_exchange_rate
 from src.values import OPENAI_API_KEY
 
+# openai and PIL are imported where used so that starting the server doesn't pay for them
+if TYPE_CHECKING:
+    from openai import Client
+
 logger = logging.getLogger(__name__)
 
 memory = Memory(CACHE_DIR / "openai_translations", verbose=0)
 
+# Runs speculative exchange rate lookups while the OpenAI request is in flight
+_forex_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="forex")
+
+# Max OpenAI requests in flight across all server threads, to stay under the account's rate limit
+OPENAI_MAX_CONCURRENT_REQUESTS = 4
+_openai_semaphore = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENT_REQUESTS)
+
+
+# Longest edge (px) of images sent to the vision model; larger uploads are downscaled
+VISION_MAX_EDGE_PX = 1024
+
 
 class TranslationError(Exception):
     """Exception raised for translation errors."""
 
 
+class ImageDecodeError(Exception):
+    """Exception raised when an uploaded image cannot be decoded."""
+
+
 # Model pricing per 1M tokens (input, output)
 MODEL_PRICING = {
     "gpt-4.1-nano": {"input": 0.20, "output": 0.80},
@@ -67,16 +92,31 @@ def _log_usage(model: str, usage, finish_reason: str, elapsed_time: float) -> No
     )
 
 
-def build_prompt(target_currency: str) -> str:
-    """Build the OpenAI prompt with target currency.
+@functools.lru_cache(maxsize=1)
+def _get_client() -> "Client":
+    """Return a shared OpenAI client so TLS connections to the API are reused across requests."""
+    import httpx
+    from openai import Client
+    from openai import DefaultHttpxClient
 
-    Args:
-        target_currency: Target currency code (e.g., EUR, USD, GBP).
+    transport = httpx.HTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+    return Client(api_key=OPENAI_API_KEY, http_client=DefaultHttpxClient(transport=transport))
+
+
+@functools.lru_cache(maxsize=1)
+def build_prompt() -> str:
+    """Build the OpenAI prompt.
+
+    The prompt does not depend on the target currency (prices are converted afterwards), so it is
+    built once and the same translation cache entry is shared across target currencies.
 
     Returns:
         Formatted prompt string.
     """
-    return """Analyze this menu image and extract all menu items. For each dish:
+    return """Analyze this menu image and extract all menu items. If several images are provided, they are pages of the same menu: extract the dishes from all of them, in page order. For each dish:
 1. Translate the dish name to English
 2. Provide a simple 1-3 sentence explanation of what the dish is, how its cooked or prepared, and any other relevant details.
 3. Provide a pronunciation guide for the dish name (layman's how to say it, not the phonetic spelling)
@@ -126,11 +166,42 @@ EXAMPLE RETURN JSON:
 Only include actual dishes/food items, not section headers or other text."""
 
 
-def _call_openai_api(image_data_base64: str, prompt: str, model: str) -> OpenAIResponse:
+def _preprocess_for_vision(image_bytes: bytes) -> bytes:
+    """Downscale an image to fit VISION_MAX_EDGE_PX and re-encode it as JPEG.
+
+    EXIF orientation is applied first so rotated phone photos stay readable.
+
+    Args:
+        image_bytes: Raw uploaded image bytes.
+
+    Returns:
+        JPEG encoded image bytes.
+
+    Raises:
+        ImageDecodeError: If the image data is corrupt or truncated. Upload validation only parses
+            the header of an image, so a broken body is first noticed here.
+    """
+    from PIL import Image
+    from PIL import ImageOps
+
+    try:
+        with Image.open(BytesIO(image_bytes)) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((VISION_MAX_EDGE_PX, VISION_MAX_EDGE_PX), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            image.convert("RGB").save(buffer, "JPEG", quality=85)
+    except (OSError, SyntaxError) as e:
+        raise ImageDecodeError(f"Could not decode image: {e}") from e
+    return buffer.getvalue()
+
+
+def _call_openai_api(images_base64: list[str], prompt: str, model: str) -> OpenAIResponse:
     """Call OpenAI API with Pydantic structured output.
 
+    All images are sent in a single request so multi-page menus are parsed in one pass.
+
     Args:
-        image_data_base64: Base64 encoded image data.
+        images_base64: Base64 encoded image data, one entry per menu page.
         prompt: Prompt text.
         model: Model name.
 
@@ -140,25 +211,27 @@ def _call_openai_api(image_data_base64: str, prompt: str, model: str) -> OpenAIR
     Raises:
         TranslationError: If response is invalid or truncated.
     """
-    start_time = time.time()
-    client = Client(api_key=OPENAI_API_KEY)
-
-    response = client.beta.chat.completions.parse(
-        model=model,
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{image_data_base64}"},
-                    },
-                ],
-            }
-        ],
-        response_format=OpenAIResponse,
-    )
+    with _openai_semaphore:
+        start_time = time.time()
+        response = _get_client().beta.chat.completions.parse(
+            model=model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        *[
+                            {
+                                "type": "image_url",
+                                "image_url": {"url": f"data:image/jpeg;base64,{image_data_base64}"},
+                            }
+                            for image_data_base64 in images_base64
+                        ],
+                    ],
+                }
+            ],
+            response_format=OpenAIResponse,
+        )
 
     elapsed_time = time.time() - start_time
 
@@ -177,6 +250,7 @@ def _call_openai_api(image_data_base64: str, prompt: str, model: str) -> OpenAIR
             f"Menu may be too complex or response too long."
         )
 
+    # The SDK already decodes and validates the content in one pass (pydantic-core's model_validate_json)
     parsed = choice.message.parsed
     if parsed is None:
         raise TranslationError(f"Failed to parse OpenAI response (finish_reason: {finish_reason})")
@@ -184,33 +258,84 @@ def _call_openai_api(image_data_base64: str, prompt: str, model: str) -> OpenAIR
     return parsed
 
 
-@memory.cache
-def _cached_translate(image_data_base64: str, prompt: str, model: str) -> dict:
+@memory.cache(ignore=["images"])
+def _cached_translate(image_hashes: tuple[str, ...], images: list[bytes], prompt: str, model: str) -> dict:
     """Cached translation - returns dict for pickle compatibility.
 
     Args:
-        image_data_base64: Base64 encoded image data (cache key).
+        image_hashes: Digests of the raw image bytes, in page order (cache key).
+        images: Raw image bytes, only encoded and sent on a cache miss (not part of the cache key).
         prompt: Prompt text (cache key).
         model: Model name (cache key).
 
     Returns:
         OpenAIResponse as dict (for joblib pickle compatibility).
     """
-    result = _call_openai_api(image_data_base64, prompt, model)
+    images_base64 = [base64.b64encode(_preprocess_for_vision(image)).decode("utf-8") for image in images]
+    result = _call_openai_api(images_base64, prompt, model)
     return result.model_dump()
 
 
+def convert_prices(prices: list[float | None], exchange_rate: float | None) -> list[float | None]:
+    """Convert a batch of prices with one exchange rate.
+
+    Args:
+        prices: Numeric prices in the original currency (None where a dish has no price).
+        exchange_rate: Rate to the target currency, or None if it is unknown.
+
+    Returns:
+        Converted prices in the same order (None where the price or the rate is missing).
+    """
+    if exchange_rate is None:
+        return [None] * len(prices)
+    return [price * exchange_rate if price is not None else None for price in prices]
+
+
+def _resolve_exchange_rate(
+    original_currency: str | None,
+    target_currency: str,
+    currency_hint: str | None,
+    forex_future: Future | None,
+) -> float | None:
+    """Resolve the exchange rate, reusing the speculative lookup if the hint was right."""
+    if forex_future is not None and original_currency != currency_hint:
+        forex_future.cancel()
+        forex_future = None
+
+    if not original_currency:
+        return None
+    if original_currency == target_currency:
+        return 1.0
+
+    if forex_future is not None:
+        exchange_rate = forex_future.result()
+    else:
+        exchange_rate = get_exchange_rate(original_currency, target_currency)
+
+    if exchange_rate is None:
+        logger.warning(
+            f"Failed to fetch exchange rate for {original_currency} to {target_currency}. "
+            "Prices will not be converted."
+        )
+    return exchange_rate
+
+
 def translate_menu_image(
-    image_path: Path,
+    image_paths: str | Path | list[str | Path],
     target_currency: str = DEFAULT_TARGET_CURRENCY,
     model: str = DEFAULT_OPENAI_MODEL,
+    currency_hint: str | None = None,
 ) -> MenuTranslation:
     """Translate a menu image using OpenAI Vision API.
 
     Args:
-        image_path: Path to the menu image file.
+        image_paths: Path to the menu image file, or a list of paths for a menu spanning several
+            images. All images are translated in a single OpenAI request.
         target_currency: Target currency code for exchange rate.
         model: OpenAI model to use (e.g., "gpt-5-mini", "gpt-5.2", "gpt-5.2-pro").
+        currency_hint: Likely source currency of the menu (e.g., from the client's previous
+            translation). If given, its exchange rate is fetched in the background while
+            the menu is being translated.
 
     Returns:
         MenuTranslation object with translated dishes.
@@ -218,52 +343,52 @@ def translate_menu_image(
     Raises:
         TranslationError: If OpenAI response is invalid or missing required fields.
     """
-    with image_path.open("rb") as f:
-        image_bytes = f.read()
+    if isinstance(image_paths, (str, Path)):
+        image_paths = [image_paths]
+    images = [Path(image_path).read_bytes() for image_path in image_paths]
 
-    image_data = base64.b64encode(image_bytes).decode("utf-8")
-    prompt = build_prompt(target_currency)
+    forex_future = None
+    if currency_hint and currency_hint != target_currency:
+        forex_future = _forex_executor.submit(get_exchange_rate, currency_hint, target_currency)
+
+    image_hashes = tuple(hashlib.blake2b(image, digest_size=16).hexdigest() for image in images)
+    prompt = build_prompt()
 
     # Get cached result (dict) and reconstruct Pydantic model
-    cached_dict = _cached_translate(image_data, prompt, model)
+    cached_dict = _cached_translate(image_hashes, images, prompt, model)
     openai_response = OpenAIResponse.model_validate(cached_dict)
 
     logger.info(
         f"Number of dishes: {len(openai_response.dishes)}, Language: {openai_response.source_language}, Currency: {openai_response.original_currency}, Country: {openai_response.country}"
     )
 
-    exchange_rate = None
-    if openai_response.original_currency:
-        if openai_response.original_currency == target_currency:
-            exchange_rate = 1.0
-        else:
-            exchange_rate = get_exchange_rate(openai_response.original_currency, target_currency)
-            if exchange_rate is None:
-                logger.warning(
-                    f"Failed to fetch exchange rate for {openai_response.original_currency} to {target_currency}. "
-                    "Prices will not be converted."
-                )
-
-    dishes = []
-    for dish in openai_response.dishes:
-        converted_price = None
-        if dish.price_numeric is not None and exchange_rate is not None:
-            converted_price = dish.price_numeric * exchange_rate
-
-        dishes.append(
-            MenuDish(
-                name=dish.name,
-                english_name=dish.english_name or dish.name,
-                description=dish.description,
-                image_urls=None,
-                original_text=dish.original_text,
-                pronunciation=dish.pronunciation,
-                price=dish.price,
-                price_numeric=dish.price_numeric,
-                converted_price=converted_price,
-                allergies=dish.allergies,
-            )
+    prices = [dish.price_numeric for dish in openai_response.dishes]
+    if any(price is not None for price in prices):
+        exchange_rate = _resolve_exchange_rate(
+            openai_response.original_currency, target_currency, currency_hint, forex_future
+        )
+    else:
+        # Nothing to convert, so skip the forex lookup
+        if forex_future is not None:
+            forex_future.cancel()
+        exchange_rate = None
+
+    converted_prices = convert_prices(prices, exchange_rate)
+    dishes = [
+        MenuDish(
+            name=dish.name,
+            english_name=dish.english_name or dish.name,
+            description=dish.description,
+            image_urls=None,
+            original_text=dish.original_text,
+            pronunciation=dish.pronunciation,
+            price=dish.price,
+            price_numeric=dish.price_numeric,
+            converted_price=converted_price,
+            allergies=dish.allergies,
         )
+        for dish, converted_price in zip(openai_response.dishes, converted_prices)
+    ]
 
     return MenuTranslation(
         dishes=dishes,
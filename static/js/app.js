@@ -19,6 +19,7 @@ const CONFIG = {
         CURRENCY: "menuTranslatorCurrency",
         MODEL: "menuTranslatorModel",
         INCLUDE_IMAGES: "menuTranslatorIncludeImages",
+        LAST_SOURCE_CURRENCY: "menuTranslatorLastSourceCurrency",
     },
     DEFAULTS: {
         CURRENCY: "EUR",
@@ -166,12 +167,13 @@ function isValidFileType(file) {
 }
 
 /**
- * Validate file size.
- * @param {File} file - File to validate
+ * Validate total upload size.
+ * @param {File[]} files - Files to validate
  * @returns {boolean} True if valid
  */
-function isValidFileSize(file) {
-    return file.size <= CONFIG.MAX_FILE_SIZE;
+function isValidFileSize(files) {
+    const totalSize = files.reduce((total, file) => total + file.size, 0);
+    return totalSize <= CONFIG.MAX_FILE_SIZE;
 }
 
 // ============================================================================
@@ -209,6 +211,8 @@ const getCurrency = () => getStorageItem(CONFIG.STORAGE_KEYS.CURRENCY, CONFIG.DE
 const setCurrency = (v) => setStorageItem(CONFIG.STORAGE_KEYS.CURRENCY, v);
 const getModel = () => getStorageItem(CONFIG.STORAGE_KEYS.MODEL, CONFIG.DEFAULTS.MODEL);
 const setModel = (v) => setStorageItem(CONFIG.STORAGE_KEYS.MODEL, v);
+const getLastSourceCurrency = () => getStorageItem(CONFIG.STORAGE_KEYS.LAST_SOURCE_CURRENCY, "");
+const setLastSourceCurrency = (v) => setStorageItem(CONFIG.STORAGE_KEYS.LAST_SOURCE_CURRENCY, v);
 
 function getIncludeImages() {
     try {
@@ -456,7 +460,7 @@ function handleDrop(e) {
 
     const files = e.dataTransfer.files;
     if (files.length > 0) {
-        handleFile(files[0]);
+        handleFiles(Array.from(files));
     }
 }
 
@@ -466,7 +470,7 @@ function handleDrop(e) {
  */
 function handleFileInputChange(e) {
     if (e.target.files && e.target.files.length > 0) {
-        handleFile(e.target.files[0]);
+        handleFiles(Array.from(e.target.files));
         // Reset input to allow re-uploading the same file
         e.target.value = "";
     }
@@ -511,17 +515,23 @@ async function retryWithBackoff(fn, attempts = CONFIG.RETRY_ATTEMPTS, delay = CO
 }
 
 /**
- * Upload and translate menu image (stage 1 - translation only).
- * @param {File} file - Image file to upload
+ * Upload and translate menu images (stage 1 - translation only).
+ * Multiple images are treated as pages of the same menu and translated in one request.
+ * @param {File[]} files - Image files to upload
  * @returns {Promise<Object>} Translation result (without images)
  */
-async function translateMenu(file) {
+async function translateMenu(files) {
     updateProgressMessage("Translating menu with AI...", "Order a drink, this'll be a minute or two.");
     
     const formData = new FormData();
-    formData.append("image", file);
+    files.forEach(file => formData.append("image", file));
     formData.append("currency", getCurrency());
     formData.append("model", getModel());
+    // Lets the server prefetch the exchange rate while the menu is being translated
+    const sourceCurrencyHint = getLastSourceCurrency();
+    if (sourceCurrencyHint) {
+        formData.append("source_currency_hint", sourceCurrencyHint);
+    }
 
     const response = await fetch("/api/translate", {
         method: "POST",
@@ -538,6 +548,9 @@ async function translateMenu(file) {
     const data = await response.json();
 
     if (data.status === "success") {
+        if (data.data.original_currency) {
+            setLastSourceCurrency(data.data.original_currency);
+        }
         return data.data;
     }
 
@@ -609,9 +622,9 @@ async function fetchImagesForDishes(dishes, language, includeImages) {
  * Handle file upload with validation and two-stage processing.
  * Stage 1: Translation (menu text extraction)
  * Stage 2: Image fetching (with progress updates)
- * @param {File} file - File to process
+ * @param {File[]} files - Files to process (pages of the same menu)
  */
-async function handleFile(file) {
+async function handleFiles(files) {
     // Cancel previous request if any
     if (state.abortController) {
         state.abortController.abort();
@@ -619,13 +632,13 @@ async function handleFile(file) {
     state.abortController = new AbortController();
 
     // Validate file type
-    if (!isValidFileType(file)) {
+    if (!files.every(isValidFileType)) {
         showError("Invalid file type. Please upload a JPG, PNG, or WEBP image.");
         return;
     }
 
-    // Validate file size
-    if (!isValidFileSize(file)) {
+    // Validate file size (the limit applies to the whole upload)
+    if (!isValidFileSize(files)) {
         showError(`File size exceeds ${CONFIG.MAX_FILE_SIZE / (1024 * 1024)}MB limit.`);
         return;
     }
@@ -637,7 +650,7 @@ async function handleFile(file) {
 
     try {
         // Stage 1: Translation
-        const translationData = await retryWithBackoff(() => translateMenu(file));
+        const translationData = await retryWithBackoff(() => translateMenu(files));
 
         // Stage 2: Fetch images (if enabled)
         const includeImages = getIncludeImages();
@@ -0,0 +1,39 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+def pytest_configure(config):
+    """Import the app and register Pillow's codecs up front, once per (xdist worker) process."""
+    from PIL import Image
+
+    import src.app  # noqa: F401
+
+    Image.init()
+
+
+@pytest.fixture
+def joblib_calls(monkeypatch: pytest.MonkeyPatch):
+    """Record the calls that reach the joblib layer of an lru_cache-over-joblib function.
+
+    Yields a function taking the memoized function and the value its joblib layer should return.
+    It patches only that function's MemorizedFunc instance and returns the list that the arguments
+    of each call reaching it are appended to. The in-process cache is cleared before and after.
+    """
+    memoized_functions = []
+
+    def record(memoized_function, return_value) -> list[tuple]:
+        calls = []
+
+        def fake_cached_call(args, kwargs, shelving):
+            calls.append(args)
+            return return_value, None
+
+        memoized_function.cache_clear()
+        memoized_functions.append(memoized_function)
+        monkeypatch.setattr(memoized_function.__wrapped__, "_cached_call", fake_cached_call)
+        return calls
+
+    yield record
+    for memoized_function in memoized_functions:
+        memoized_function.cache_clear()
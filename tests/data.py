@@ -0,0 +1,53 @@
+"""Pre-encoded 100x100 solid red test images, so tests don't run Pillow's encoders."""
+
+JPEG_BYTES = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912"
+    "130f141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432ffdb0043010909"
+    "090c0b0c180d0d1832211c21323232323232323232323232323232323232323232323232323232323232323232323232"
+    "3232323232323232323232323232ffc00011080064006403012200021101031101ffc4001f0000010501010101010100"
+    "000000000000000102030405060708090a0bffc400b5100002010303020403050504040000017d010203000411051221"
+    "31410613516107227114328191a1082342b1c11552d1f02433627282090a161718191a25262728292a3435363738393a"
+    "434445464748494a535455565758595a636465666768696a737475767778797a838485868788898a9293949596979899"
+    "9aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1"
+    "f2f3f4f5f6f7f8f9faffc4001f0100030101010101010101010000000000000102030405060708090a0bffc400b51100"
+    "020102040403040705040400010277000102031104052131061241510761711322328108144291a1b1c109233352f015"
+    "6272d10a162434e125f11718191a262728292a35363738393a434445464748494a535455565758595a63646566676869"
+    "6a737475767778797a82838485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4"
+    "c5c6c7c8c9cad2d3d4d5d6d7d8d9dae2e3e4e5e6e7e8e9eaf2f3f4f5f6f7f8f9faffda000c03010002110311003f00e2"
+    "e8a28af993f710a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a2"
+    "8a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a2"
+    "8a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a2"
+    "8a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a28a2800a2"
+    "8a2800a28a2803ffd9"
+)
+
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000064000000640802000000ff800203000000e649444154789cedd0410900"
+    "2000c040b57f67ade05e22dc25189b7b706bbd0ef8895981598159815981598159815981598159815981598159815981"
+    "598159815981598159815981598159815981598159815981598159815981598159815981598159815981598159815981"
+    "598159815981598159815981598159815981598159815981598159815981598159815981598159815981598159815981"
+    "598159815981598159815981598159815981598159815981598159815981598159815981598159815981598159815981"
+    "59815981598159815981598159815981598159815981598159c1018a5e01c7f1841a7a0000000049454e44ae426082"
+)
+
+WEBP_BYTES = bytes.fromhex(
+    "524946466600000057454250565038205a0000001006009d012a640064003e6d369949a42322a120a800800d89696ee1"
+    "73e9701f8000018daea6f71179601aea6f71179601aea6f71179601a7800fefe517dffff905cb0bae46bffff203fe407"
+    "fc80fff8f8a646952a7420000000"
+)
+
+# Encoded bytes by Pillow format name
+SAMPLE_IMAGES = {
+    "JPEG": JPEG_BYTES,
+    "PNG": PNG_BYTES,
+    "WEBP": WEBP_BYTES,
+}
+
+# Images whose header parses but whose pixel data cannot be decoded, by file extension:
+# a PNG with an overwritten IDAT chunk and a JPEG cut off partway through its scan data
+_IDAT_DATA = PNG_BYTES.index(b"IDAT") + 4
+_JPEG_SCAN_DATA = JPEG_BYTES.index(b"\xff\xda") + 14
+CORRUPT_BODY_IMAGES = {
+    "png": PNG_BYTES[:_IDAT_DATA] + b"\xff" * 8 + PNG_BYTES[_IDAT_DATA + 8 :],
+    "jpg": JPEG_BYTES[: _JPEG_SCAN_DATA + 40],
+}
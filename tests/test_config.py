@@ -2,55 +2,48 @@
 Tests for the configuration module.
 
 These tests verify that:
-1. Individual config flags return correct values
-2. --all flag returns all configuration values
+1. --all flag returns all configuration values
+2. An individual config flag returns its value
 3. Missing flag produces an error
 4. --help shows all options
 """
 
 import pytest
 import typer
-from typer.testing import CliRunner
 
 from src.config import config_cli
 
-app = typer.Typer()
-app.command()(config_cli)
 
-runner = CliRunner()
+EXPECTED = {
+    "project_name": "whats-on-the-menu",
+    "project_version": "0.1.0",
+    "flask_port": "5011",
+    "max_upload_size_mb": "10",
+    "default_target_currency": "EUR",
+    "default_openai_model": "gpt-5-mini",
+    "brave_max_requests_per_second": "1",
+}
 
 
-@pytest.mark.parametrize(
-    "flag,expected_output",
-    [
-        ("--project-name", "whats-on-the-menu"),
-        ("--project-version", "0.1.0"),
-        ("--flask-port", "5011"),
-        ("--max-upload-size-mb", "10"),
-    ],
-)
-def test_config_returns_single_value(flag: str, expected_output: str):
-    """Test that individual flags return their correct values."""
-    result = runner.invoke(app, [flag])
+def test_config_all_fields_correct(capsys: pytest.CaptureFixture[str]):
+    """Test that --all flag returns every configuration value."""
+    config_cli(all=True)
 
-    assert result.exit_code == 0
-    assert result.stdout.strip() == expected_output
+    out = capsys.readouterr().out
+    assert dict(line.split("=", 1) for line in out.splitlines()) == EXPECTED
 
 
-def test_config_all_returns_all_values():
-    """Test that --all flag returns all configuration values."""
-    result = runner.invoke(app, ["--all"])
+def test_config_returns_single_value(capsys: pytest.CaptureFixture[str]):
+    """Test that an individual flag returns only its value."""
+    config_cli(flask_port=True)
 
-    assert result.exit_code == 0
-    assert "project_name=whats-on-the-menu" in result.stdout
-    assert "project_version=0.1.0" in result.stdout
-    assert "flask_port=5011" in result.stdout
-    assert "max_upload_size_mb=10" in result.stdout
+    assert capsys.readouterr().out.strip() == EXPECTED["flask_port"]
 
 
-def test_config_without_flag_fails():
+def test_config_without_flag_fails(capsys: pytest.CaptureFixture[str]):
     """Test that calling config without any flag produces an error."""
-    result = runner.invoke(app, [])
+    with pytest.raises(typer.Exit) as exc_info:
+        config_cli()
 
-    assert result.exit_code == 1
-    assert "Error: No config key specified" in result.output
+    assert exc_info.value.exit_code == 1
+    assert "Error: No config key specified" in capsys.readouterr().err
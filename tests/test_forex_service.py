@@ -0,0 +1,69 @@
+"""Tests for forex service."""
+
+import pytest
+import responses
+
+from src.services import forex_service
+from src.services.forex_service import get_exchange_rate
+
+
+@pytest.fixture
+def fetched_rates(monkeypatch: pytest.MonkeyPatch):
+    """Replace the exchange rate API call and record each fetch."""
+    forex_service._get_exchange_rate_for_hour.cache_clear()
+    calls = []
+
+    def fake_fetch(from_currency: str, to_currency: str) -> float:
+        calls.append((from_currency, to_currency))
+        return 1.08
+
+    monkeypatch.setattr(forex_service, "_fetch_exchange_rate", fake_fetch)
+    yield calls
+    forex_service._get_exchange_rate_for_hour.cache_clear()
+
+
+def test_get_exchange_rate_same_currency(fetched_rates):
+    """Test that identical currencies return 1.0 without an API call."""
+    assert get_exchange_rate("EUR", "EUR") == 1.0
+    assert fetched_rates == []
+
+
+def test_get_exchange_rate_cached_within_hour(fetched_rates, monkeypatch: pytest.MonkeyPatch):
+    """Test that a rate is fetched once per hour and refreshed in the next one."""
+    monkeypatch.setattr(forex_service.time, "time", lambda: 3600 * 100 + 10)
+    assert get_exchange_rate("USD", "EUR") == 1.08
+    monkeypatch.setattr(forex_service.time, "time", lambda: 3600 * 100 + 3000)
+    assert get_exchange_rate("USD", "EUR") == 1.08
+    assert fetched_rates == [("USD", "EUR")]
+
+    monkeypatch.setattr(forex_service.time, "time", lambda: 3600 * 101 + 10)
+    get_exchange_rate("USD", "EUR")
+    assert fetched_rates == [("USD", "EUR"), ("USD", "EUR")]
+
+
+@responses.activate
+def test_fetch_exchange_rate_parses_response():
+    """Test that the rate is read from the API response."""
+    responses.get("https://api.exchangerate-api.com/v4/latest/USD", json={"rates": {"EUR": 0.92}})
+
+    assert forex_service._fetch_exchange_rate("USD", "EUR") == 0.92
+
+
+@responses.activate
+def test_fetch_exchange_rate_unknown_currency():
+    """Test that a missing target currency raises ValueError."""
+    responses.get("https://api.exchangerate-api.com/v4/latest/USD", json={"rates": {"GBP": 0.79}})
+
+    with pytest.raises(ValueError, match="Currency EUR not found"):
+        forex_service._fetch_exchange_rate("USD", "EUR")
+
+
+def test_get_supported_currency_codes_repeat_call_skips_joblib(joblib_calls):
+    """Test that repeated currency code lookups are answered in-process without reaching joblib."""
+    calls = joblib_calls(forex_service.get_supported_currency_codes, ["EUR", "USD"])
+
+    first = forex_service.get_supported_currency_codes()
+    second = forex_service.get_supported_currency_codes()
+
+    assert first == second == ["EUR", "USD"]
+    assert calls == [()]
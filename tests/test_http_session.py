@@ -0,0 +1,46 @@
+"""Tests for shared HTTP helpers."""
+
+import pytest
+
+from src.services import http_session
+from src.services.http_session import RateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch):
+    """Replace monotonic time and sleep with a manually advanced clock; returns recorded sleeps."""
+    clock = {"now": 1000.0}
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(http_session.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(http_session.time, "sleep", fake_sleep)
+    return clock, sleeps
+
+
+def test_rate_limiter_does_not_wait_under_limit(fake_clock):
+    """Test that calls within the limit return immediately."""
+    _, sleeps = fake_clock
+    limiter = RateLimiter(max_calls=2, period=1.0)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert sleeps == []
+
+
+def test_rate_limiter_waits_only_for_remaining_window(fake_clock):
+    """Test that an over-limit call sleeps until the oldest call leaves the window."""
+    clock, sleeps = fake_clock
+    limiter = RateLimiter(max_calls=1, period=1.0)
+
+    limiter.acquire()
+    clock["now"] += 0.25
+    limiter.acquire()
+    clock["now"] += 5.0
+    limiter.acquire()
+
+    assert sleeps == [pytest.approx(0.75)]
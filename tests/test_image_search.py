@@ -0,0 +1,77 @@
+"""Tests for the Brave image search service."""
+
+import pytest
+import responses
+from responses import matchers
+
+from src.services import image_search_brave
+from src.services.image_search_brave import BRAVE_API_BASE_URL
+
+# Undecorated search function, bypassing the in-process and on-disk caches
+_brave_search = image_search_brave.cached_brave_search.__wrapped__.func
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch: pytest.MonkeyPatch):
+    """Disable the Brave rate limiter so tests do not wait."""
+    monkeypatch.setattr(image_search_brave._rate_limiter, "acquire", lambda: None)
+
+
+@responses.activate
+def test_brave_search_known_language_uses_language_params():
+    """Test that a mapped language sets search_lang/country and filters small images."""
+    responses.get(
+        BRAVE_API_BASE_URL,
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "q": "Ratatouille",
+                    "count": "10",
+                    "search_lang": "fr",
+                    "country": "FR",
+                    "spellcheck_off": "true",
+                }
+            )
+        ],
+        json={
+            "results": [
+                {"properties": {"url": "https://example.com/big.jpg", "width": 800, "height": 600}},
+                {"properties": {"url": "https://example.com/small.jpg", "width": 100, "height": 100}},
+            ]
+        },
+    )
+
+    assert _brave_search("Ratatouille", "French", "test-key") == ["https://example.com/big.jpg"]
+
+
+@responses.activate
+def test_brave_search_unknown_language_falls_back_to_query():
+    """Test that an unmapped language is appended to the query with default params."""
+    responses.get(
+        BRAVE_API_BASE_URL,
+        match=[
+            matchers.query_param_matcher(
+                {
+                    "q": "Plov food Klingon",
+                    "count": "10",
+                    "search_lang": "en",
+                    "country": "ALL",
+                    "spellcheck_off": "true",
+                }
+            )
+        ],
+        json={"results": []},
+    )
+
+    assert _brave_search("Plov", "Klingon", "test-key") == []
+
+
+def test_cached_brave_search_repeat_call_skips_joblib(joblib_calls):
+    """Test that a repeated search is answered in-process without reaching the joblib cache."""
+    calls = joblib_calls(image_search_brave.cached_brave_search, ["https://example.com/paella.jpg"])
+
+    first = image_search_brave.cached_brave_search("Paella", "Spanish", "test-key")
+    second = image_search_brave.cached_brave_search("Paella", "Spanish", "test-key")
+
+    assert first == second == ["https://example.com/paella.jpg"]
+    assert calls == [("Paella", "Spanish", "test-key")]
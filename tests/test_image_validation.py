@@ -5,18 +5,28 @@ from pathlib import Path
 
 import pytest
 from PIL import Image
+from werkzeug.datastructures import FileStorage
 
 from src.image_validation import ImageValidationError
 from src.image_validation import save_uploaded_image
-from src.image_validation import validate_image_file
+from tests.data import JPEG_BYTES
+from tests.data import PNG_BYTES
+from tests.data import SAMPLE_IMAGES
 
+# Just over the 10MB upload limit; allocated once at import
+_BIG_BYTES = b"\0" * (11 * 1024 * 1024)
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Save uploads to a per-test directory instead of TMP_DIR."""
+    monkeypatch.setattr("src.image_validation.TMP_DIR", tmp_path)
+    return tmp_path
 
-def create_test_image(format: str = "JPEG") -> bytes:
-    """Create a test image in memory."""
-    img = Image.new("RGB", (100, 100), color="red")
-    buffer = io.BytesIO()
-    img.save(buffer, format=format)
-    return buffer.getvalue()
+
+def _upload(image_data: bytes, filename: str) -> Path:
+    """Run image_data through save_uploaded_image as a request upload."""
+    return save_uploaded_image(FileStorage(io.BytesIO(image_data), filename=filename))
 
 
 @pytest.mark.parametrize(
@@ -28,51 +38,94 @@ def create_test_image(format: str = "JPEG") -> bytes:
         ("WEBP", "webp"),
     ],
 )
-def test_validate_image_file_valid_formats(format: str, extension: str):
-    """Test validation accepts supported image formats."""
-    image_data = create_test_image(format)
-    validate_image_file(image_data, f"test.{extension}")
+def test_save_uploaded_image_valid_formats(format: str, extension: str):
+    """Test that saving accepts supported image formats."""
+    image_data = SAMPLE_IMAGES[format]
+    _upload(image_data, f"test.{extension}")
+
+
+def test_save_uploaded_image_extension_mismatch_falls_back_to_pillow():
+    """Test that saving accepts a real image whose magic bytes don't match the extension."""
+    image_data = PNG_BYTES
+    _upload(image_data, "test.jpg")
 
 
-def test_validate_image_file_invalid_format():
-    """Test validation rejects unsupported formats."""
-    image_data = create_test_image("JPEG")
+def test_save_uploaded_image_large_mismatched_image_verifies_full_file():
+    """Test that an image larger than the verified header is accepted via the full-file fallback."""
+    img = Image.frombytes("RGB", (200, 200), bytes(range(256)) * 468 + bytes(192))
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=0)
+    image_data = buffer.getvalue()
+    assert len(image_data) > 64 * 1024
+
+    _upload(image_data, "test.jpg")
+
+
+def test_save_uploaded_image_corrupt_mismatched_image():
+    """Test that saving rejects a corrupt image that Pillow reports with SyntaxError."""
+    image_data = bytearray(PNG_BYTES)
+    middle = len(image_data) // 2
+    image_data[middle : middle + 4] = b"\x00\x00\x00\x00"
+    with pytest.raises(ImageValidationError, match="Invalid image file"):
+        _upload(bytes(image_data), "test.jpg")
+
+
+def test_save_uploaded_image_invalid_format():
+    """Test that saving rejects unsupported formats."""
+    image_data = JPEG_BYTES
     with pytest.raises(ImageValidationError, match="Unsupported file format"):
-        validate_image_file(image_data, "test.avi")
+        _upload(image_data, "test.avi")
+
+
+def test_save_uploaded_image_too_large():
+    """Test that saving rejects files exceeding size limit when the upload has no content length."""
+    with pytest.raises(ImageValidationError, match="exceeds maximum"):
+        _upload(_BIG_BYTES, "test.jpg")
 
 
-def test_validate_image_file_too_large():
-    """Test validation rejects files exceeding size limit."""
-    large_data = b"x" * (11 * 1024 * 1024)
+def test_save_uploaded_image_too_large_content_length(upload_dir: Path):
+    """Test that a declared content length over the limit is rejected before anything is written."""
+    file_storage = FileStorage(io.BytesIO(JPEG_BYTES), filename="test.jpg", content_length=11 * 1024 * 1024)
     with pytest.raises(ImageValidationError, match="exceeds maximum"):
-        validate_image_file(large_data, "test.jpg")
+        save_uploaded_image(file_storage)
 
+    assert list(upload_dir.iterdir()) == []
 
-def test_validate_image_file_invalid_image():
-    """Test validation rejects invalid image data."""
+
+def test_save_uploaded_image_invalid_image():
+    """Test that saving rejects invalid image data."""
     invalid_data = b"not an image"
     with pytest.raises(ImageValidationError, match="Invalid image file"):
-        validate_image_file(invalid_data, "test.jpeg")
+        _upload(invalid_data, "test.jpeg")
 
 
-def test_save_uploaded_image(tmp_path: Path):
+def test_save_uploaded_image(upload_dir: Path):
     """Test saving uploaded image."""
-    image_data = create_test_image()
-    file_path = save_uploaded_image(image_data, "test.jpeg")
+    image_data = JPEG_BYTES
+    file_path = _upload(image_data, "test.jpeg")
 
     assert file_path.exists()
+    assert file_path.parent == upload_dir
     assert file_path.suffix == ".jpeg"
     assert file_path.read_bytes() == image_data
 
 
-def test_validate_image_file_empty_filename():
-    """Test validation rejects empty filename."""
-    image_data = create_test_image()
+def test_save_uploaded_image_invalid_image_is_removed(upload_dir: Path):
+    """Test that an upload failing validation is not left on disk."""
+    with pytest.raises(ImageValidationError, match="Invalid image file"):
+        _upload(b"not an image", "test.jpg")
+
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_save_uploaded_image_empty_filename():
+    """Test that saving rejects empty filename."""
+    image_data = JPEG_BYTES
     with pytest.raises(ImageValidationError, match="Filename cannot be empty"):
-        validate_image_file(image_data, "")
+        _upload(image_data, "")
 
 
-def test_validate_image_file_empty_content():
-    """Test validation rejects empty file content."""
+def test_save_uploaded_image_empty_content():
+    """Test that saving rejects empty file content."""
     with pytest.raises(ImageValidationError, match="File is empty"):
-        validate_image_file(b"", "test.jpg")
+        _upload(b"", "test.jpg")
@@ -1,65 +1,113 @@
 """Tests for OpenAI service."""
 
+import hashlib
+import io
+import threading
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
+from PIL import Image
 
 from src.datamodels import MenuTranslation
+from src.services import openai_service
+from src.services.openai_service import ImageDecodeError
 from src.services.openai_service import TranslationError
+from src.services.openai_service import _preprocess_for_vision
+from src.services.openai_service import convert_prices
 from src.services.openai_service import translate_menu_image
+from tests.data import CORRUPT_BODY_IMAGES
+from tests.data import JPEG_BYTES
 
 
-def create_test_image_file(tmp_path: Path) -> Path:
-    """Create a test image file."""
-    from PIL import Image
+class _FakeCall:
+    """Plain callable stand-in that records positional call arguments."""
 
-    img = Image.new("RGB", (100, 100), color="red")
-    file_path = tmp_path / "test_menu.jpg"
-    img.save(file_path, "JPEG")
-    return file_path
+    def __init__(self):
+        self.calls: list[tuple] = []
+        self.called = threading.Event()
+        self.return_value = None
+        self.side_effect: Exception | None = None
 
+    def __call__(self, *args):
+        self.calls.append(args)
+        self.called.set()
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
 
-def create_openai_response_dict(
-    source_language: str,
-    country: str,
-    dishes: list[dict],
-    original_currency: str | None = None,
-) -> dict:
-    """Create an OpenAI response dict for mocking."""
-    return {
-        "source_language": source_language,
-        "country": country,
-        "dishes": dishes,
-        "original_currency": original_currency,
-    }
 
+@pytest.fixture
+def cached_translate(monkeypatch: pytest.MonkeyPatch) -> _FakeCall:
+    """Replace the cached OpenAI call with a fake."""
+    fake = _FakeCall()
+    monkeypatch.setattr(openai_service, "_cached_translate", fake)
+    return fake
+
+
+@pytest.fixture
+def exchange_rate(monkeypatch: pytest.MonkeyPatch) -> _FakeCall:
+    """Replace the exchange rate lookup with a fake."""
+    fake = _FakeCall()
+    monkeypatch.setattr(openai_service, "get_exchange_rate", fake)
+    return fake
+
+
+def _translate_after_lookup(response: dict, exchange_rate: _FakeCall, lookups_seen: list) -> Callable:
+    """Return a _cached_translate stand-in that waits for an exchange rate lookup before returning.
+
+    The lookups made by the time the translation returns are copied into lookups_seen, so tests can
+    tell a speculative lookup apart from one made after the translation.
+    """
 
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_success(mock_cached_translate, mock_get_exchange_rate, tmp_path: Path):
+    def fake(*args):
+        exchange_rate.called.wait(timeout=1)
+        lookups_seen.extend(exchange_rate.calls)
+        return response
+
+    return fake
+
+
+# Response and dish templates; tests override only the fields they care about
+_BASE_RESPONSE = {
+    "source_language": "Spanish",
+    "country": "Spain",
+    "dishes": [],
+    "original_currency": "EUR",
+}
+_BASE_DISH = {
+    "name": "Paella",
+    "english_name": "Paella",
+    "description": "Rice dish.",
+    "pronunciation": "pie-AY-uh",
+    "original_text": "Paella",
+    "price": None,
+    "price_numeric": None,
+}
+
+
+def test_translate_menu_image_success(cached_translate: _FakeCall, exchange_rate: _FakeCall, tmp_path: Path):
     """Test successful menu translation."""
-    image_path = create_test_image_file(tmp_path)
+    image_path = tmp_path / "test_menu.jpg"
+    image_path.write_bytes(JPEG_BYTES)
 
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="Spanish",
-        country="Spain",
-        original_currency="EUR",
-        dishes=[
+    cached_translate.return_value = {
+        **_BASE_RESPONSE,
+        "dishes": [
             {
+                **_BASE_DISH,
                 "name": "Paella Valenciana",
                 "english_name": "Valencian Paella",
                 "description": "Traditional Spanish rice dish with seafood.",
                 "pronunciation": "pie-AY-uh val-en-see-AH-nuh",
                 "original_text": "Paella Valenciana",
                 "price": "€18.00",
-                "price_numeric": None,
             }
         ],
-    )
-    mock_get_exchange_rate.return_value = 1.0
+    }
+    exchange_rate.return_value = 1.0
 
-    result = translate_menu_image(image_path)
+    result = translate_menu_image(str(image_path))
 
     assert isinstance(result, MenuTranslation)
     assert result.source_language == "Spanish"
@@ -68,41 +116,45 @@ def test_translate_menu_image_success(mock_cached_translate, mock_get_exchange_r
     assert result.dishes[0].description == "Traditional Spanish rice dish with seafood."
     assert result.dishes[0].original_text == "Paella Valenciana"
 
-    mock_cached_translate.assert_called_once()
+    assert len(cached_translate.calls) == 1
+    image_bytes = image_path.read_bytes()
+    image_hashes, images = cached_translate.calls[0][:2]
+    assert image_hashes == (hashlib.blake2b(image_bytes, digest_size=16).hexdigest(),)
+    assert images == [image_bytes]
 
 
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_multiple_dishes(mock_cached_translate, mock_get_exchange_rate, tmp_path: Path):
+def test_translate_menu_image_multiple_dishes(
+    cached_translate: _FakeCall, exchange_rate: _FakeCall, tmp_path: Path
+):
     """Test translation with multiple dishes."""
-    image_path = create_test_image_file(tmp_path)
-
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="French",
-        country="France",
-        original_currency="EUR",
-        dishes=[
+    image_path = tmp_path / "test_menu.jpg"
+    image_path.write_bytes(JPEG_BYTES)
+
+    cached_translate.return_value = {
+        **_BASE_RESPONSE,
+        "source_language": "French",
+        "country": "France",
+        "dishes": [
             {
+                **_BASE_DISH,
                 "name": "Coq au Vin",
                 "english_name": "Chicken in Wine",
                 "description": "Chicken braised with wine.",
                 "pronunciation": "coke oh van",
                 "original_text": "Coq au Vin",
                 "price": "€22.50",
-                "price_numeric": None,
             },
             {
+                **_BASE_DISH,
                 "name": "Bouillabaisse",
                 "english_name": "Provençal Fish Stew",
                 "description": "Provençal fish stew.",
                 "pronunciation": "boo-yah-BAYS",
                 "original_text": "Bouillabaisse",
-                "price": None,
-                "price_numeric": None,
             },
         ],
-    )
-    mock_get_exchange_rate.return_value = 1.0
+    }
+    exchange_rate.return_value = 1.0
 
     result = translate_menu_image(image_path)
 
@@ -111,148 +163,179 @@ def test_translate_menu_image_multiple_dishes(mock_cached_translate, mock_get_ex
     assert result.dishes[1].name == "Bouillabaisse"
 
 
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_file_not_found(mock_cached_translate):
+def test_translate_menu_image_multiple_images(
+    cached_translate: _FakeCall, exchange_rate: _FakeCall, tmp_path: Path
+):
+    """Test that all pages of a menu are translated in a single cached call."""
+    first_page = tmp_path / "test_menu.jpg"
+    first_page.write_bytes(JPEG_BYTES)
+    second_page = tmp_path / "test_menu_2.png"
+    second_page.write_bytes(b"second page")
+
+    cached_translate.return_value = {
+        **_BASE_RESPONSE,
+        "source_language": "French",
+        "country": "France",
+        "original_currency": None,
+    }
+
+    result = translate_menu_image([str(first_page), second_page])
+
+    assert result.source_language == "French"
+    assert len(cached_translate.calls) == 1
+    image_hashes, images = cached_translate.calls[0][:2]
+    assert len(image_hashes) == 2
+    assert images == [first_page.read_bytes(), b"second page"]
+
+
+def test_translate_menu_image_file_not_found(cached_translate: _FakeCall):
     """Test error when image file doesn't exist."""
-    image_path = Path("nonexistent.jpg")
+    image_path = "nonexistent.jpg"
 
     with pytest.raises(FileNotFoundError):
         translate_menu_image(image_path)
 
-    mock_cached_translate.assert_not_called()
+    assert cached_translate.calls == []
 
 
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_translation_error_propagates(mock_cached_translate, tmp_path: Path):
+def test_translate_menu_image_translation_error_propagates(cached_translate: _FakeCall, tmp_path: Path):
     """Test that TranslationError from _cached_translate propagates."""
-    image_path = create_test_image_file(tmp_path)
+    image_path = tmp_path / "test_menu.jpg"
+    image_path.write_bytes(JPEG_BYTES)
 
-    mock_cached_translate.side_effect = TranslationError("API error")
+    cached_translate.side_effect = TranslationError("API error")
 
     with pytest.raises(TranslationError, match="API error"):
         translate_menu_image(image_path)
 
 
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_with_custom_currency(
-    mock_cached_translate, mock_get_exchange_rate, tmp_path: Path
+@pytest.mark.parametrize(
+    "original_currency,price_numeric,target_currency,fetched_rate,expected_rate,expected_price,expected_lookups",
+    [
+        pytest.param(
+            "EUR", 12.0, "USD", 1.1, 1.1, pytest.approx(13.2), [("EUR", "USD")], id="custom_currency"
+        ),
+        pytest.param("USD", 10.0, "EUR", None, None, None, [("USD", "EUR")], id="forex_fetch_failure"),
+        pytest.param("EUR", 15.0, "EUR", 0.5, 1.0, 15.0, [], id="same_currency_no_conversion"),
+        pytest.param(
+            "JPY",
+            1000.0,
+            "EUR",
+            0.0067,
+            0.0067,
+            pytest.approx(6.7, rel=0.01),
+            [("JPY", "EUR")],
+            id="price_conversion",
+        ),
+        pytest.param("CHF", None, "EUR", 0.9, None, None, [], id="no_prices_skips_forex"),
+    ],
+)
+def test_translate_menu_image_currency_conversion(
+    cached_translate: _FakeCall,
+    exchange_rate: _FakeCall,
+    original_currency: str,
+    price_numeric: float | None,
+    target_currency: str,
+    fetched_rate: float | None,
+    expected_rate: float | None,
+    expected_price: float | None,
+    expected_lookups: list[tuple[str, str]],
+    tmp_path: Path,
 ):
-    """Test translation with custom target currency."""
-    image_path = create_test_image_file(tmp_path)
-
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="Italian",
-        country="Italy",
-        original_currency="EUR",
-        dishes=[
-            {
-                "name": "Pasta",
-                "english_name": "Pasta",
-                "description": "Italian pasta dish.",
-                "pronunciation": "PAH-stuh",
-                "original_text": "Pasta",
-                "price": "€12.00",
-                "price_numeric": None,
-            }
-        ],
-    )
-    mock_get_exchange_rate.return_value = 1.1
-
-    result = translate_menu_image(image_path, target_currency="USD")
+    """Test exchange rate lookup and price conversion for the detected menu currency."""
+    image_path = tmp_path / "test_menu.jpg"
+    image_path.write_bytes(JPEG_BYTES)
 
-    assert result.source_language == "Italian"
-    assert result.target_currency == "USD"
-
-
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_forex_fetch_failure(
-    mock_cached_translate, mock_get_exchange_rate, tmp_path: Path
+    cached_translate.return_value = {
+        **_BASE_RESPONSE,
+        "original_currency": original_currency,
+        "dishes": [{**_BASE_DISH, "price_numeric": price_numeric}],
+    }
+    exchange_rate.return_value = fetched_rate
+
+    result = translate_menu_image(image_path, target_currency=target_currency)
+
+    assert exchange_rate.calls == expected_lookups
+    assert result.target_currency == target_currency
+    assert result.exchange_rate_to_eur == expected_rate
+    assert result.dishes[0].converted_price == expected_price
+
+
+@pytest.mark.parametrize(
+    "currency_hint,expected_lookups_seen,expected_calls",
+    [
+        pytest.param("JPY", [("JPY", "EUR")], [("JPY", "EUR")], id="correct_hint_reused"),
+        pytest.param("USD", [("USD", "EUR")], [("USD", "EUR"), ("JPY", "EUR")], id="wrong_hint_refetched"),
+    ],
+)
+def test_translate_menu_image_currency_hint(
+    currency_hint: str,
+    expected_lookups_seen: list[tuple[str, str]],
+    expected_calls: list[tuple[str, str]],
+    exchange_rate: _FakeCall,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ):
-    """Test handling when forex fetch fails - prices should not be converted."""
-    image_path = create_test_image_file(tmp_path)
-
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="English",
-        country="United States",
-        original_currency="USD",
-        dishes=[
-            {
-                "name": "Burger",
-                "english_name": "Burger",
-                "description": "A burger.",
-                "pronunciation": "BUR-ger",
-                "original_text": "Burger",
-                "price": "$10.00",
-                "price_numeric": 10.0,
-            }
-        ],
+    """Test that the hinted rate is fetched during translation, and the detected one after if it differs."""
+    image_path = tmp_path / "test_menu.jpg"
+    image_path.write_bytes(JPEG_BYTES)
+
+    response = {
+        **_BASE_RESPONSE,
+        "original_currency": "JPY",
+        "dishes": [{**_BASE_DISH, "price_numeric": 1000.0}],
+    }
+    exchange_rate.return_value = 0.0067
+    lookups_seen = []
+    monkeypatch.setattr(
+        openai_service, "_cached_translate", _translate_after_lookup(response, exchange_rate, lookups_seen)
     )
-    mock_get_exchange_rate.return_value = None
-
-    result = translate_menu_image(image_path, target_currency="EUR")
 
-    assert result.dishes[0].converted_price is None
-
-
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_same_currency_no_conversion(
-    mock_cached_translate, mock_get_exchange_rate, tmp_path: Path
+    result = translate_menu_image(image_path, target_currency="EUR", currency_hint=currency_hint)
+
+    assert lookups_seen == expected_lookups_seen
+    assert exchange_rate.calls == expected_calls
+    assert result.exchange_rate_to_eur == 0.0067
+
+
+@pytest.mark.parametrize(
+    "prices,exchange_rate,expected",
+    [
+        ([10.0, None, 2.5], 2.0, [20.0, None, 5.0]),
+        ([10.0, None], None, [None, None]),
+        ([], 1.5, []),
+    ],
+)
+def test_convert_prices(prices: list, exchange_rate: float | None, expected: list):
+    """Test batch price conversion keeps order and missing values."""
+    assert convert_prices(prices, exchange_rate) == expected
+
+
+@pytest.mark.parametrize(
+    "size,expected_size",
+    [
+        ((120, 60), (64, 32)),
+        ((40, 40), (40, 40)),
+    ],
+)
+def test_preprocess_for_vision_downscales_to_jpeg(
+    size: tuple[int, int], expected_size: tuple[int, int], monkeypatch: pytest.MonkeyPatch
 ):
-    """Test that same source and target currency uses 1.0 exchange rate."""
-    image_path = create_test_image_file(tmp_path)
-
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="German",
-        country="Germany",
-        original_currency="EUR",
-        dishes=[
-            {
-                "name": "Schnitzel",
-                "english_name": "Schnitzel",
-                "description": "Breaded cutlet.",
-                "pronunciation": "SHNIT-sel",
-                "original_text": "Schnitzel",
-                "price": "€15.00",
-                "price_numeric": 15.0,
-            }
-        ],
-    )
-
-    result = translate_menu_image(image_path, target_currency="EUR")
+    """Test that large images are downscaled and all images are re-encoded as JPEG."""
+    # A small limit keeps the test images small and the test fast
+    monkeypatch.setattr(openai_service, "VISION_MAX_EDGE_PX", 64)
+    buffer = io.BytesIO()
+    Image.new("RGBA", size, color="red").save(buffer, "PNG")
 
-    # Should not call get_exchange_rate when currencies match
-    mock_get_exchange_rate.assert_not_called()
-    assert result.exchange_rate_to_eur == 1.0
-    assert result.dishes[0].converted_price == 15.0
+    result = _preprocess_for_vision(buffer.getvalue())
 
+    with Image.open(io.BytesIO(result)) as image:
+        assert image.format == "JPEG"
+        assert image.size == expected_size
 
-@patch("src.services.openai_service.get_exchange_rate")
-@patch("src.services.openai_service._cached_translate")
-def test_translate_menu_image_price_conversion(mock_cached_translate, mock_get_exchange_rate, tmp_path: Path):
-    """Test that prices are correctly converted using exchange rate."""
-    image_path = create_test_image_file(tmp_path)
-
-    mock_cached_translate.return_value = create_openai_response_dict(
-        source_language="Japanese",
-        country="Japan",
-        original_currency="JPY",
-        dishes=[
-            {
-                "name": "Ramen",
-                "english_name": "Ramen",
-                "description": "Japanese noodle soup.",
-                "pronunciation": "RAH-men",
-                "original_text": "ラーメン",
-                "price": "¥1000",
-                "price_numeric": 1000.0,
-            }
-        ],
-    )
-    mock_get_exchange_rate.return_value = 0.0067  # 1 JPY = 0.0067 EUR
-
-    result = translate_menu_image(image_path, target_currency="EUR")
 
-    assert result.dishes[0].converted_price == pytest.approx(6.7, rel=0.01)
+@pytest.mark.parametrize("extension", ["png", "jpg"])
+def test_preprocess_for_vision_corrupt_body(extension: str):
+    """Test that an image with a valid header but undecodable pixel data raises ImageDecodeError."""
+    with pytest.raises(ImageDecodeError, match="Could not decode image"):
+        _preprocess_for_vision(CORRUPT_BODY_IMAGES[extension])
@@ -1,37 +1,48 @@
 """Tests for upload handler (Flask routes)."""
 
 import io
-import json
 from unittest.mock import patch
 
 import pytest
-from PIL import Image
+from werkzeug.test import Client
 
 from src.app import app
+from src.image_validation import ImageValidationError
+from src.services import openai_service
+from src.services.openai_service import TranslationError
+from tests.data import CORRUPT_BODY_IMAGES
+from tests.data import JPEG_BYTES
 
+app.config["TESTING"] = True
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
-    app.config["TESTING"] = True
-    with app.test_client() as test_client:
-        yield test_client
+    """Create a test client shared by the tests in this module.
+
+    A plain Werkzeug client is enough: no test relies on Flask's session or context preservation.
+    """
+    return Client(app)
+
+
+class _RewindingBytesIO(io.BytesIO):
+    """BytesIO that rewinds instead of closing, so one upload stream can be reused across requests."""
 
+    def close(self) -> None:
+        self.seek(0)
 
-@pytest.fixture
-def sample_image():
-    """Create sample image bytes."""
-    img = Image.new("RGB", (100, 100), color="red")
-    buffer = io.BytesIO()
-    img.save(buffer, format="JPEG")
-    return buffer.getvalue()
+
+@pytest.fixture(scope="module")
+def sample_upload():
+    """Upload stream of the sample image, shared by single-image requests."""
+    return _RewindingBytesIO(JPEG_BYTES)
 
 
 def test_status_endpoint(client):
     """Test health check endpoint."""
     response = client.get("/status")
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "ok"
 
 
@@ -42,26 +53,26 @@ def test_index_endpoint(client):
     assert b"What's On the Menu?" in response.data
 
 
-@patch("src.app.translate_menu_image")
-@patch("src.app.save_uploaded_image")
+@patch("src.app.translate_menu_image", spec=True)
+@patch("src.app.save_uploaded_image", spec=True)
 def test_translate_endpoint_success(
     mock_save,
     mock_translate,
     client,
-    sample_image,
+    sample_upload,
     tmp_path,
 ):
     """Test successful translation (returns dishes without images)."""
     image_path = tmp_path / "test.jpg"
-    image_path.write_bytes(sample_image)
+    image_path.write_bytes(JPEG_BYTES)
     mock_save.return_value = image_path
 
     from src.datamodels import MenuDish
     from src.datamodels import MenuTranslation
 
-    mock_translation = MenuTranslation(
+    mock_translation = MenuTranslation.model_construct(
         dishes=[
-            MenuDish(
+            MenuDish.model_construct(
                 name="Paella",
                 english_name="Paella",
                 description="Spanish rice dish.",
@@ -81,12 +92,12 @@ def test_translate_endpoint_success(
 
     response = client.post(
         "/api/translate",
-        data={"image": (io.BytesIO(sample_image), "test.jpg")},
+        data={"image": (sample_upload, "test.jpg")},
         content_type="multipart/form-data",
     )
 
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "success"
     assert data["data"]["source_language"] == "Spanish"
     assert len(data["data"]["dishes"]) == 1
@@ -95,7 +106,32 @@ def test_translate_endpoint_success(
     assert data["data"]["dishes"][0]["image_urls"] is None
 
 
-@patch("src.app.cached_brave_search")
+@patch("src.app.translate_menu_image", spec=True)
+@patch("src.app.save_uploaded_image", spec=True)
+def test_translate_endpoint_multiple_images(mock_save, mock_translate, client, tmp_path):
+    """Test that several uploaded pages are translated together in one call."""
+    from src.datamodels import MenuTranslation
+
+    image_paths = [tmp_path / "page1.jpg", tmp_path / "page2.jpg"]
+    for image_path in image_paths:
+        image_path.write_bytes(JPEG_BYTES)
+    mock_save.side_effect = image_paths
+    mock_translate.return_value = MenuTranslation(dishes=[], source_language="Spanish", country="Spain")
+
+    response = client.post(
+        "/api/translate",
+        data={"image": [(io.BytesIO(JPEG_BYTES), "page1.jpg"), (io.BytesIO(JPEG_BYTES), "page2.jpg")]},
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 200
+    assert mock_save.call_count == 2
+    mock_translate.assert_called_once()
+    assert mock_translate.call_args.args[0] == image_paths
+    assert not any(image_path.exists() for image_path in image_paths)
+
+
+@patch("src.app.cached_brave_search", spec=True)
 def test_fetch_images_endpoint_success(mock_brave_search, client):
     """Test successful image fetch."""
     mock_brave_search.return_value = ["https://example.com/paella.jpg"]
@@ -111,13 +147,13 @@ def test_fetch_images_endpoint_success(mock_brave_search, client):
     )
 
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "success"
     assert "Paella" in data["images"]
     assert data["images"]["Paella"] == ["https://example.com/paella.jpg"]
 
 
-@patch("src.app.cached_brave_search")
+@patch("src.app.cached_brave_search", spec=True)
 def test_fetch_images_endpoint_with_placeholder(mock_brave_search, client):
     """Test image fetch with placeholder fallback."""
     mock_brave_search.return_value = []  # Empty results
@@ -133,11 +169,41 @@ def test_fetch_images_endpoint_with_placeholder(mock_brave_search, client):
     )
 
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "success"
     assert "placeholder.com" in data["images"]["Paella"][0]
 
 
+@patch("src.app.cached_brave_search", spec=True)
+def test_fetch_images_endpoint_multiple_dishes(mock_brave_search, client):
+    """Test image fetch searches every dish and isolates per-dish failures."""
+    from src.services.image_search_brave import ImageSearchError
+
+    def fake_search(dish_name, language, api_key):
+        if dish_name == "Tortilla":
+            raise ImageSearchError("API error")
+        return [f"https://example.com/{dish_name.lower()}.jpg"]
+
+    mock_brave_search.side_effect = fake_search
+
+    response = client.post(
+        "/api/fetch-images",
+        json={
+            "dishes": [{"name": "Paella"}, {"name": "Tortilla"}, {"name": "Gazpacho"}],
+            "language": "Spanish",
+            "include_images": True,
+        },
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert mock_brave_search.call_count == 3
+    assert data["images"]["Paella"] == ["https://example.com/paella.jpg"]
+    assert data["images"]["Tortilla"] is None
+    assert data["images"]["Gazpacho"] == ["https://example.com/gazpacho.jpg"]
+
+
 def test_fetch_images_endpoint_include_images_false(client):
     """Test image fetch with include_images=false returns null."""
     response = client.post(
@@ -151,7 +217,7 @@ def test_fetch_images_endpoint_include_images_false(client):
     )
 
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "success"
     assert data["images"]["Paella"] is None
 
@@ -163,62 +229,115 @@ def test_fetch_images_endpoint_no_json(client):
     assert response.status_code in (400, 415)
 
 
-def test_translate_endpoint_no_file(client):
-    """Test translation endpoint with no file."""
-    response = client.post("/api/translate")
+def test_fetch_images_endpoint_malformed_json(client):
+    """Test image fetch with a malformed JSON body returns 400."""
+    response = client.post("/api/fetch-images", data="{not json", content_type="application/json")
     assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data["status"] == "error"
-    assert "No image file provided" in data["message"]
 
 
-def test_translate_endpoint_empty_filename(client):
-    """Test translation endpoint with empty filename."""
-    response = client.post(
-        "/api/translate",
-        data={"image": (b"", "")},
-        content_type="multipart/form-data",
-    )
-    assert response.status_code == 400
-    data = json.loads(response.data)
+def _raise(error: Exception):
+    """Return a stand-in function that raises error when called."""
+
+    def fake(*args, **kwargs):
+        raise error
+
+    return fake
+
+
+@pytest.mark.parametrize(
+    "filename,save_error,translate_error,expected_status,expected_message",
+    [
+        pytest.param(None, None, None, 400, "No image file provided", id="no_file"),
+        pytest.param("", None, None, 400, "Filename cannot be empty", id="empty_filename"),
+        pytest.param(
+            "test.jpg",
+            ImageValidationError("File too large"),
+            None,
+            400,
+            "File too large",
+            id="validation_error",
+        ),
+        pytest.param(
+            "test.jpg",
+            None,
+            TranslationError("API error"),
+            500,
+            "Translation failed: API error",
+            id="translation_error",
+        ),
+        pytest.param(
+            "test.jpg", None, ValueError("Invalid response"), 500, "unexpected error", id="unexpected_error"
+        ),
+    ],
+)
+def test_translate_endpoint_errors(
+    filename: str | None,
+    save_error: Exception | None,
+    translate_error: Exception | None,
+    expected_status: int,
+    expected_message: str,
+    client,
+    sample_upload,
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that upload, validation and translation failures return an error response."""
+    if save_error is not None:
+        monkeypatch.setattr("src.app.save_uploaded_image", _raise(save_error))
+    if translate_error is not None:
+        monkeypatch.setattr("src.app.save_uploaded_image", lambda file: tmp_path / "test.jpg")
+        monkeypatch.setattr("src.app.translate_menu_image", _raise(translate_error))
+
+    form = {} if filename is None else {"image": (sample_upload, filename)}
+    response = client.post("/api/translate", data=form, content_type="multipart/form-data")
+
+    assert response.status_code == expected_status
+    data = response.get_json()
     assert data["status"] == "error"
-
-
-@patch("src.app.save_uploaded_image")
-def test_translate_endpoint_validation_error(mock_save, client, sample_image):
-    """Test translation endpoint handles validation errors."""
-    from src.image_validation import ImageValidationError
-
-    mock_save.side_effect = ImageValidationError("File too large")
+    assert expected_message in data["message"]
+
+
+@pytest.mark.parametrize(
+    "content,filename",
+    [
+        pytest.param(b"\xff\xd8\xff" + b"garbage" * 50, "menu.jpg", id="jpeg"),
+        pytest.param(b"\x89PNG\r\n\x1a\n" + b"garbage" * 50, "menu.png", id="png"),
+        pytest.param(b"RIFF\x00\x00\x00\x00WEBP" + b"garbage" * 50, "menu.webp", id="webp"),
+    ],
+)
+def test_translate_endpoint_corrupt_image_with_valid_magic_bytes(
+    content: bytes, filename: str, client, tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a corrupt upload whose magic bytes match its extension is rejected with a 400."""
+    monkeypatch.setattr("src.image_validation.TMP_DIR", tmp_path)
 
     response = client.post(
         "/api/translate",
-        data={"image": (io.BytesIO(sample_image), "test.jpg")},
+        data={"image": (io.BytesIO(content), filename)},
         content_type="multipart/form-data",
     )
 
     assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data["status"] == "error"
-    assert "File too large" in data["message"]
+    assert "Invalid image file" in response.get_json()["message"]
+    assert list(tmp_path.iterdir()) == []
 
 
-@patch("src.app.save_uploaded_image")
-@patch("src.app.translate_menu_image")
-def test_translate_endpoint_translation_error(mock_translate, mock_save, client, sample_image, tmp_path):
-    """Test translation endpoint handles translation errors."""
-    image_path = tmp_path / "test.jpg"
-    image_path.write_bytes(sample_image)
-    mock_save.return_value = image_path
-
-    mock_translate.side_effect = ValueError("Invalid response")
+@pytest.mark.parametrize("extension", ["png", "jpg"])
+def test_translate_endpoint_corrupt_image_body(
+    extension: str, client, tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that an upload with a valid header but a corrupt body is rejected with a 400 when decoded."""
+    monkeypatch.setattr("src.image_validation.TMP_DIR", tmp_path)
+    monkeypatch.setattr("src.app.TMP_DIR", tmp_path)
+    # Bypass the joblib cache so the upload is really decoded
+    monkeypatch.setattr(openai_service, "_cached_translate", openai_service._cached_translate.func)
 
     response = client.post(
         "/api/translate",
-        data={"image": (io.BytesIO(sample_image), "test.jpg")},
+        data={"image": (io.BytesIO(CORRUPT_BODY_IMAGES[extension]), f"menu.{extension}")},
         content_type="multipart/form-data",
     )
 
-    assert response.status_code == 500
-    data = json.loads(response.data)
-    assert data["status"] == "error"
+    assert response.status_code == 400
+    assert "Could not decode image" in response.get_json()["message"]
+    assert [path.name for path in tmp_path.iterdir()] == ["metadata.jsonl"]